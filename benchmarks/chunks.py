@@ -0,0 +1,55 @@
+"""Time timestamp reinterpretation and rendering on many tiny chunks.
+
+Compares `ChunkedArray.cast()` with what timestampmath does instead: coalesce
+small chunks, then reinterpret them without copying. Run from the repository
+root:
+
+    poetry run python benchmarks/chunks.py
+"""
+import timeit
+
+import pyarrow as pa
+
+from timestampmath import _coalesce_small_chunks, _reinterpret, render_arrow_v1
+
+N_CHUNKS = 10000
+N_RUNS = 20
+
+
+def _time_ms(fn) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=N_RUNS)) * 1000
+
+
+def main():
+    timestamps = pa.chunked_array(
+        [[i * 1000000000] for i in range(N_CHUNKS)], pa.timestamp("ns")
+    )
+    ints = timestamps.cast(pa.int64())
+    table = pa.table({"A": timestamps})
+
+    cases = [
+        ("cast timestamp => int64", lambda: timestamps.cast(pa.int64())),
+        (
+            "coalesce + reinterpret timestamp => int64",
+            lambda: _reinterpret(_coalesce_small_chunks(timestamps), pa.int64()),
+        ),
+        ("cast int64 => timestamp", lambda: ints.cast(pa.timestamp("ns"))),
+        (
+            "coalesce + reinterpret int64 => timestamp",
+            lambda: _reinterpret(_coalesce_small_chunks(ints), pa.timestamp("ns")),
+        ),
+        (
+            "render startof",
+            lambda: render_arrow_v1(
+                table, {"operation": "startof", "colnames": ["A"], "roundunit": "hour"}
+            ),
+        ),
+    ]
+
+    print("%d one-row chunks, best of %d runs" % (N_CHUNKS, N_RUNS))
+    for name, fn in cases:
+        print("%-45s %8.2fms" % (name, _time_ms(fn)))
+
+
+if __name__ == "__main__":
+    main()
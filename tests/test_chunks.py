@@ -0,0 +1,47 @@
+import pyarrow as pa
+import pytest
+
+from timestampmath import (
+    _coalesce_small_chunks,
+    _read_target_chunk_length,
+    _reinterpret,
+)
+
+
+def test_coalesce_small_chunks():
+    column = pa.chunked_array([[1], [2], [None], [4], [5]], pa.timestamp("ns"))
+    result = _coalesce_small_chunks(column, 2)
+    assert [len(chunk) for chunk in result.chunks] == [2, 2, 1]
+    assert result.equals(column)
+
+
+def test_coalesce_small_chunks_leave_large_chunks():
+    column = pa.chunked_array([[1, 2], [3, 4]], pa.timestamp("ns"))
+    assert _coalesce_small_chunks(column, 2) is column
+
+
+def test_read_target_chunk_length(monkeypatch):
+    monkeypatch.setenv("TIMESTAMPMATH_TARGET_CHUNK_LENGTH", "100")
+    assert _read_target_chunk_length() == 100
+
+
+def test_read_target_chunk_length_default(monkeypatch):
+    monkeypatch.delenv("TIMESTAMPMATH_TARGET_CHUNK_LENGTH", raising=False)
+    assert _read_target_chunk_length() == 65536
+
+
+def test_read_target_chunk_length_invalid(monkeypatch):
+    monkeypatch.setenv("TIMESTAMPMATH_TARGET_CHUNK_LENGTH", "64k")
+    with pytest.warns(UserWarning, match="TIMESTAMPMATH_TARGET_CHUNK_LENGTH"):
+        assert _read_target_chunk_length() == 65536
+
+
+def test_reinterpret_zero_copy():
+    column = pa.chunked_array([[1, 2], [None, 3]], pa.timestamp("ns"))
+    result = _reinterpret(column, pa.int64())
+    assert result.type == pa.int64()
+    assert result.to_pylist() == [1, 2, None, 3]
+    for chunk, result_chunk in zip(column.chunks, result.chunks):
+        assert [b.address if b else None for b in result_chunk.buffers()] == [
+            b.address if b else None for b in chunk.buffers()
+        ]
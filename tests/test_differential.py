@@ -0,0 +1,163 @@
+"""Compare every operation against a slow, obviously-correct reference.
+
+Each test builds random tables -- random chunking, nulls and extreme values --
+renders them, and checks the result against pure-Python math on ints.
+Timestamps are compared as int64 nanoseconds since the epoch.
+"""
+import random
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+from cjwmodule.spec.testing import param_factory
+
+import timestampmath
+from timestampmath import _NS_PER_UNIT, _reinterpret
+from timestampmath import render_arrow_v1 as render
+
+P = param_factory(Path(__file__).parent.parent / "timestampmath.yaml")
+
+# -2**63 is NaT in pandas and numpy; Workbench timestamps never hold it
+MIN_NS = -(2 ** 63) + 1
+MAX_NS = 2 ** 63 - 1
+SEEDS = range(30)
+STARTOF_UNITS = ["hour", "minute", "second", "millisecond", "microsecond"]
+
+
+@pytest.fixture(params=[0, 1, 3, 65536], ids=lambda n: f"chunk{n}")
+def target_chunk_length(request, monkeypatch):
+    """Run each test with and without coalescing small chunks."""
+    monkeypatch.setattr(timestampmath, "_TARGET_CHUNK_LENGTH", request.param)
+
+
+def _random_value(rng):
+    if rng.random() < 0.2:
+        return None
+    ns = rng.choice(list(_NS_PER_UNIT.values()))
+    earliest = -(2 ** 63 // ns) * ns  # earliest whole unit int64 can hold
+    value = rng.choice(
+        [
+            lambda: rng.randint(MIN_NS, MAX_NS),
+            lambda: rng.randint(-(10 ** 18), 10 ** 18),  # years 1938-2001
+            lambda: rng.choice([MIN_NS, MAX_NS, 0, 1, -1, ns, -ns]),
+            lambda: MIN_NS + rng.randint(0, 2 * ns),
+            lambda: MAX_NS - rng.randint(0, 2 * ns),
+            lambda: earliest + rng.randint(-1, 1),
+            lambda: rng.randint(-5, 5) * ns + rng.randint(-1, 1),
+        ]
+    )()
+    return min(max(value, MIN_NS), MAX_NS)
+
+
+def _random_table(rng, colnames):
+    n_rows = rng.randint(0, 20)
+    columns = [[_random_value(rng) for _ in range(n_rows)] for _ in colnames]
+
+    # Split all columns at the same random offsets, as Parquet row groups do.
+    # Zero-length batches are allowed.
+    offsets = sorted(rng.randint(0, n_rows) for _ in range(rng.randint(0, 5)))
+    starts = [0] + offsets
+    stops = offsets + [n_rows]
+    schema = pa.schema([(colname, pa.timestamp("ns")) for colname in colnames])
+    batches = [
+        pa.record_batch(
+            [
+                pa.array(values[start:stop], pa.int64()).view(pa.timestamp("ns"))
+                for values in columns
+            ],
+            schema=schema,
+        )
+        for start, stop in zip(starts, stops)
+    ]
+    return pa.Table.from_batches(batches, schema=schema), columns
+
+
+def _to_ints(column):
+    return _reinterpret(column, pa.int64()).to_pylist()
+
+
+def _wrap_int64(value):
+    """Overflow as unchecked int64 subtraction does."""
+    return (value + 2 ** 63) % 2 ** 64 - 2 ** 63
+
+
+def _reference_reduce(fn, row):
+    values = [value for value in row if value is not None]
+    return fn(values) if values else None
+
+
+def _reference_difference(value1, value2, unit):
+    if value1 is None or value2 is None:
+        return None
+    difference = _wrap_int64(value2 - value1)
+    if unit == "nanosecond":
+        return difference
+    else:
+        return float(difference) / float(_NS_PER_UNIT[unit])
+
+
+def _reference_startof(value, unit):
+    """Round `value` down to `unit`, or None if the result is out of bounds."""
+    if value is None:
+        return None
+    ns = _NS_PER_UNIT[unit]
+    rounded = value - value % ns  # Python % rounds toward -infinity
+    return rounded if rounded >= MIN_NS else None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("operation,fn", [("minimum", min), ("maximum", max)])
+def test_minimum_or_maximum(target_chunk_length, seed, operation, fn):
+    rng = random.Random(seed)
+    colnames = ["A", "B", "C"][: rng.randint(1, 3)]
+    table, columns = _random_table(rng, ["A", "B", "C"])
+
+    result = render(table, P(operation=operation, colnames=colnames, outcolname="Out"))
+
+    assert result.errors == []
+    assert result.table.column_names == ["A", "B", "C", "Out"]
+    assert result.table["Out"].type == pa.timestamp("ns")
+    assert _to_ints(result.table["Out"]) == [
+        _reference_reduce(fn, row) for row in zip(*columns[: len(colnames)])
+    ]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("unit", list(_NS_PER_UNIT.keys()))
+def test_difference(target_chunk_length, seed, unit):
+    rng = random.Random(seed)
+    table, (values1, values2) = _random_table(rng, ["A", "B"])
+
+    result = render(
+        table,
+        P(
+            operation="difference",
+            colname1="A",
+            colname2="B",
+            unit=unit,
+            outcolname="Out",
+        ),
+    )
+
+    assert result.errors == []
+    assert result.table.column_names == ["A", "B", "Out"]
+    assert result.table["Out"].to_pylist() == [
+        _reference_difference(value1, value2, unit)
+        for value1, value2 in zip(values1, values2)
+    ]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("unit", STARTOF_UNITS)
+def test_startof(target_chunk_length, seed, unit):
+    rng = random.Random(seed)
+    table, (values1, values2) = _random_table(rng, ["A", "B"])
+
+    result = render(table, P(operation="startof", colnames=["A"], roundunit=unit))
+
+    expected = [_reference_startof(value, unit) for value in values1]
+    any_out_of_bounds = expected.count(None) > values1.count(None)
+    assert len(result.errors) == (1 if any_out_of_bounds else 0)
+    assert result.table.column_names == ["A", "B"]
+    assert _to_ints(result.table["A"]) == expected
+    assert _to_ints(result.table["B"]) == values2
@@ -127,6 +127,25 @@ def test_maximum_nulls():
     )
 
 
+def test_maximum_many_tiny_chunks():
+    table = pa.Table.from_batches(
+        [
+            pa.record_batch(
+                [
+                    pa.array([i], pa.timestamp("ns")),
+                    pa.array([10000 - i], pa.timestamp("ns")),
+                ],
+                ["A", "B"],
+            )
+            for i in range(10000)
+        ]
+    )
+    result = render(table, P(operation="maximum", colnames=["A", "B"], outcolname="C"))
+    assert result.table["C"].cast(pa.int64()).to_pylist() == [
+        max(i, 10000 - i) for i in range(10000)
+    ]
+
+
 def test_minimum():
     assert_result_equals(
         render(
@@ -494,6 +513,47 @@ def test_difference_nanoseconds_null():
     )
 
 
+def test_difference_many_chunks():
+    result = render(
+        pa.table(
+            {
+                "A": pa.chunked_array([[1, 2], [3]], pa.timestamp("ns")),
+                "B": pa.chunked_array([[3, 4], [None]], pa.timestamp("ns")),
+            }
+        ),
+        P(
+            operation="difference",
+            colname1="A",
+            colname2="B",
+            unit="nanosecond",
+            outcolname="C",
+        ),
+    )
+    assert result.errors == []
+    assert result.table.column_names == ["A", "B", "C"]
+    assert result.table["C"].to_pylist() == [2, 2, None]
+
+
+def test_difference_many_tiny_chunks():
+    table = pa.table(
+        {
+            "A": pa.chunked_array([[i] for i in range(10000)], pa.timestamp("ns")),
+            "B": pa.chunked_array([[2 * i] for i in range(10000)], pa.timestamp("ns")),
+        }
+    )
+    result = render(
+        table,
+        P(
+            operation="difference",
+            colname1="A",
+            colname2="B",
+            unit="nanosecond",
+            outcolname="C",
+        ),
+    )
+    assert result.table["C"].to_pylist() == list(range(10000))
+
+
 def test_startof_hour():
     assert_result_equals(
         render(
@@ -515,6 +575,21 @@ def test_startof_hour():
     )
 
 
+def test_startof_many_tiny_chunks():
+    table = pa.table(
+        {
+            "A": pa.chunked_array(
+                [[i * 1000000000] for i in range(-5000, 5000)], pa.timestamp("ns")
+            ),
+        }
+    )
+    result = render(table, P(operation="startof", colnames=["A"], roundunit="hour"))
+    assert result.errors == []
+    assert result.table["A"].cast(pa.int64()).to_pylist() == [
+        (i * 1000000000) // 3600000000000 * 3600000000000 for i in range(-5000, 5000)
+    ]
+
+
 def test_startof_out_of_bounds():
     assert_result_equals(
         render(
@@ -538,3 +613,27 @@ def test_startof_out_of_bounds():
             ],
         ),
     )
+
+
+def test_startof_earliest_hour_in_bounds():
+    # Within one hour of the int64 minimum, but rounds to an int64 hour
+    earliest_hour = -(2 ** 63 // 3600000000000) * 3600000000000
+    assert_result_equals(
+        render(
+            make_table(make_column("A", [earliest_hour + 1], pa.timestamp("ns"))),
+            P(operation="startof", colnames=["A"], roundunit="hour"),
+        ),
+        ArrowRenderResult(
+            make_table(make_column("A", [earliest_hour], pa.timestamp("ns")))
+        ),
+    )
+
+
+def test_startof_earliest_minute_in_bounds():
+    assert_result_equals(
+        render(
+            make_table(make_column("A", [dt(1677, 9, 21, 0, 13, 0, 500000)])),
+            P(operation="startof", colnames=["A"], roundunit="minute"),
+        ),
+        ArrowRenderResult(make_table(make_column("A", [dt(1677, 9, 21, 0, 13)]))),
+    )
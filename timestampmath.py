@@ -1,4 +1,6 @@
-from typing import List, NamedTuple
+import os
+import warnings
+from typing import List, NamedTuple, Optional
 
 import numpy as np
 import pyarrow as pa
@@ -18,6 +20,94 @@ _NS_PER_UNIT = {
 }
 
 
+class _UnitPlan(NamedTuple):
+    """Scalars for math in one unit, built once instead of on every render."""
+
+    factor: pa.Scalar  # int64 nanoseconds per unit
+    float_factor: pa.Scalar  # float64 nanoseconds per unit
+    earliest: pa.Scalar  # int64: earliest whole unit int64 can hold
+
+
+_UNIT_PLANS = {
+    unit: _UnitPlan(
+        factor=pa.scalar(ns, pa.int64()),
+        float_factor=pa.scalar(ns, pa.float64()),
+        earliest=pa.scalar(-(2 ** 63 // ns) * ns, pa.int64()),
+    )
+    for unit, ns in _NS_PER_UNIT.items()
+}
+_NULL_BOOL = pa.scalar(None, pa.bool_())
+
+_DEFAULT_TARGET_CHUNK_LENGTH = 65536
+
+
+def _read_target_chunk_length() -> int:
+    """Read TIMESTAMPMATH_TARGET_CHUNK_LENGTH, falling back to the default.
+
+    A malformed value warns instead of making the module fail to import.
+    """
+    value = os.environ.get("TIMESTAMPMATH_TARGET_CHUNK_LENGTH", "")
+    if not value:
+        return _DEFAULT_TARGET_CHUNK_LENGTH
+    try:
+        return int(value)
+    except ValueError:
+        warnings.warn(
+            "Ignoring invalid TIMESTAMPMATH_TARGET_CHUNK_LENGTH=%r; using %d"
+            % (value, _DEFAULT_TARGET_CHUNK_LENGTH)
+        )
+        return _DEFAULT_TARGET_CHUNK_LENGTH
+
+
+# Per-chunk loops pay Python and kernel-dispatch overhead on every chunk. Tables
+# built from many tiny batches get coalesced to chunks of this length first.
+# Set to 0 to disable coalescing.
+_TARGET_CHUNK_LENGTH = _read_target_chunk_length()
+
+
+def _coalesce_small_chunks(
+    column: pa.ChunkedArray, target_length: Optional[int] = None
+) -> pa.ChunkedArray:
+    """Rechunk `column` into `target_length`-row chunks, if it is fragmented.
+
+    A column is fragmented when it has more chunks than it would need at
+    `target_length` rows apiece. Columns of a table that share chunk boundaries
+    still share chunk boundaries after coalescing.
+
+    `target_length` defaults to `_TARGET_CHUNK_LENGTH`.
+    """
+    if target_length is None:
+        target_length = _TARGET_CHUNK_LENGTH
+    if target_length <= 0:
+        return column
+    n_chunks_needed = -(-len(column) // target_length)  # ceil
+    if column.num_chunks <= n_chunks_needed:
+        return column
+
+    array = pa.concat_arrays(column.chunks)
+    return pa.chunked_array(
+        [
+            array.slice(offset, target_length)
+            for offset in range(0, len(array), target_length)
+        ],
+        column.type,
+    )
+
+
+def _reinterpret(column: pa.ChunkedArray, data_type: pa.DataType) -> pa.ChunkedArray:
+    """Reinterpret `column` as `data_type`, without copying or validating buffers.
+
+    `data_type` must have the same physical layout as `column.type`. For
+    instance, `pa.timestamp("ns")` and `pa.int64()` are interchangeable.
+
+    This costs a Python call per chunk, so it is slower than `column.cast()` on
+    fragmented columns. Pass it `_coalesce_small_chunks(column)`.
+    """
+    return pa.chunked_array(
+        [chunk.view(data_type) for chunk in column.chunks], data_type
+    )
+
+
 def migrate_params(params):
     if "roundunit" not in params:
         params = _migrate_params_v0_to_v1(params)
@@ -35,11 +125,11 @@ def _render_minimum_or_maximum(table, colnames, outcolname, fn):
 
     out_np_arrays = []
 
-    num_chunks = table[colnames[0]].num_chunks
+    columns = [_coalesce_small_chunks(table[colname]) for colname in colnames]
+    num_chunks = columns[0].num_chunks
     for chunk in range(num_chunks):
         in_np_arrays = [
-            table[colname].chunk(chunk).to_numpy(zero_copy_only=False)
-            for colname in colnames
+            column.chunk(chunk).to_numpy(zero_copy_only=False) for column in columns
         ]
         out_np_array = fn.reduce(in_np_arrays)
         out_np_arrays.append(out_np_array)
@@ -72,10 +162,9 @@ def _render_difference(table, colname1, colname2, unit, outcolname):
     else:
         out_type = pa.float64()
         out_metadata = {"format": "{:,}"}
-    num_chunks = table[colname1].num_chunks
-    for chunk in range(num_chunks):
-        chunk1 = table[colname1].chunk(chunk).cast(pa.int64())
-        chunk2 = table[colname2].chunk(chunk).cast(pa.int64())
+    column1 = _reinterpret(_coalesce_small_chunks(table[colname1]), pa.int64())
+    column2 = _reinterpret(_coalesce_small_chunks(table[colname2]), pa.int64())
+    for chunk1, chunk2 in zip(column1.chunks, column2.chunks):
         # TODO subtract_checked and report error
         difference_in_ns = pa.compute.subtract(chunk2, chunk1)
 
@@ -85,7 +174,7 @@ def _render_difference(table, colname1, colname2, unit, outcolname):
         else:
             out_array = pa.compute.divide(
                 difference_in_ns.cast(pa.float64(), safe=False),
-                pa.scalar(_NS_PER_UNIT[unit], pa.float64()),
+                _UNIT_PLANS[unit].float_factor,
             )
         out_arrays.append(out_array)
 
@@ -106,41 +195,39 @@ class StartofColumnResult(NamedTuple):
 
 
 def _startof(column: pa.ChunkedArray, unit: str) -> StartofColumnResult:
-    factor = pa.scalar(_NS_PER_UNIT[unit], pa.int64())
-    timestamp_ints = column.cast(pa.int64())
+    plan = _UNIT_PLANS[unit]
+    factor = plan.factor
+    column = _coalesce_small_chunks(column)
+    timestamp_ints = _reinterpret(column, pa.int64())
 
-    # In two's complement, truncation rounds _up_. Subtract before truncating.
+    # Integer division truncates toward zero, so it rounds negatives _up_.
+    # Where it rounded up, subtract one more factor to round down.
     #
-    # In decimal, if we're truncating to the nearest 10:
+    # In decimal, if we're rounding down to the nearest 10:
     #
     # 0 => 0
-    # -1 => -10
-    # -9 => -10
+    # -1 => 0 - 10 = -10
+    # -9 => 0 - 10 = -10
     # -10 => -10
-    # -11 => -20
-    #
-    # ... rule is: subtract 9 from all negative numbers, then truncate.
-
-    negative = pa.compute.less(timestamp_ints, pa.scalar(0, pa.int64()))
-    # "offset": -9 for negatives, 0 for others
-    offset = pa.compute.multiply(
-        negative.cast(pa.int64()), pa.scalar(-1 * _NS_PER_UNIT[unit] + 1, pa.int64())
+    # -11 => -10 - 10 = -20
+    truncated = pa.compute.multiply(pa.compute.divide(timestamp_ints, factor), factor)
+    rounded_up = pa.compute.less(timestamp_ints, truncated)
+    # Subtracting may overflow: the result is garbage before plan.earliest
+    rounded_down = pa.compute.subtract(
+        truncated, pa.compute.multiply(rounded_up.cast(pa.int64()), factor)
     )
-    # to_truncate may overflow; in that case, to_truncate > timestamp_ints
-    to_truncate = pa.compute.add(timestamp_ints, offset)
-    truncated = pa.compute.multiply(pa.compute.divide(to_truncate, factor), factor)
 
     # Mask of [True, None, True, True, None]
     safe_or_null = pa.compute.or_kleene(
-        pa.compute.less_equal(to_truncate, timestamp_ints), pa.scalar(None, pa.bool_())
+        pa.compute.greater_equal(timestamp_ints, plan.earliest), _NULL_BOOL
     )
 
-    truncated_or_null = truncated.filter(
+    truncated_or_null = rounded_down.filter(
         safe_or_null, null_selection_behavior="emit_null"
     )
 
     return StartofColumnResult(
-        column=truncated_or_null.cast(pa.timestamp("ns")),
+        column=_reinterpret(truncated_or_null, pa.timestamp("ns")),
         truncated=(truncated_or_null.null_count > column.null_count),
     )
 